@@ -109,6 +109,7 @@ def main(
         typer.echo("Please run from a directory where you have write permissions.")
         raise typer.Exit(code=1) from None
 
+    ctx.call_on_close(snapshots.close)
     ctx.obj = {"config": config, "snapshots": snapshots}
     ctx.obj["root_flags"] = {
         "new": new,
@@ -42,15 +42,18 @@ async def save_session_command(
 async def _list_sessions(config: Config, snapshots: Snapshots):
     sessions = await snapshots.list_sessions(config.user_id)
     if sessions:
-        typer.echo("Saved Sessions:")
-        typer.echo(f"{'TAG':<15} {'CONVERSATION_ID':<38} {'MODEL':<20} {'CREATED_AT':<20}")
-        typer.echo("-" * 95)
+        lines = [
+            "Saved Sessions:",
+            f"{'TAG':<15} {'CONVERSATION_ID':<38} {'MODEL':<20} {'CREATED_AT':<20}",
+            "-" * 95,
+        ]
         for session in sessions:
             created_at = datetime.datetime.fromtimestamp(session["created_at"])
             model_info = f"{session['model_config'].get('provider', 'N/A')}/{session['model_config'].get('model', 'N/A')}"
-            typer.echo(
+            lines.append(
                 f"{session['tag']:15} {session['conversation_id']:38} {model_info:20} {created_at.strftime('%Y-%m-%d %H:%M:%S'):20}"
             )
+        typer.echo("\n".join(lines))
     else:
         typer.echo("No sessions saved.")
 
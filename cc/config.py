@@ -2,6 +2,7 @@
 
 import json
 import os
+import stat
 import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -61,8 +62,21 @@ class Config:
     def save(self) -> None:
         if not self.config_dir.exists():
             self.config_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        # Write a private temp file beside the target and rename it over cc.json, so readers
+        # and concurrent writers only ever see a complete file. mkstemp creates it as 0600;
+        # an existing cc.json keeps its own mode.
+        fd, tmp_path = tempfile.mkstemp(dir=self.config_dir, prefix="cc.json.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                try:
+                    os.fchmod(f.fileno(), stat.S_IMODE(self.config_file.stat().st_mode))
+                except FileNotFoundError:
+                    pass
+                json.dump(self.to_dict(), f, indent=2)
+            os.replace(tmp_path, self.config_file)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
 
     def update(self, **kwargs) -> None:
         for key, value in kwargs.items():
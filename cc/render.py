@@ -1,6 +1,7 @@
 """Minimal stream renderer - just print events."""
 
 import json
+from functools import lru_cache
 
 GRAY = "\033[90m"
 GREEN = "\033[32m"
@@ -11,38 +12,70 @@ YELLOW = "\033[33m"
 R = "\033[0m"
 
 
+@lru_cache(maxsize=256)
+def _format_call(content: str) -> str:
+    call = json.loads(content)
+    name = call.get("name", "?")
+    args = call.get("args", {})
+    arg_str = ", ".join(f"{k}={v!r}" for k, v in list(args.items())[:2])
+    if len(args) > 2:
+        arg_str += ", ..."
+    return f"\n{GRAY}○ {name}({arg_str}){R}"
+
+
+def _on_user(event):
+    if event.get("content"):
+        print(f"{CYAN}${R} {event['content']}")
+
+
+def _on_think(event):
+    if event.get("content"):
+        print(f"{GRAY}{event['content']}{R}", end="", flush=True)
+
+
+def _on_respond(event):
+    if event.get("content"):
+        print(event["content"], end="", flush=True)
+
+
+def _on_call(event):
+    print(_format_call(event.get("content", "{}")))
+
+
+def _on_result(event):
+    payload = event.get("payload", {})
+    is_error = payload.get("error", False)
+    symbol = f"{RED}✗{R}" if is_error else f"{GREEN}●{R}"
+    msg = payload.get("outcome") or payload.get("message") or "ok"
+    print(f"{symbol} {msg}")
+
+
+def _on_error(event):
+    msg = event.get("payload", {}).get("error") or event.get("content", "error")
+    print(f"{RED}✗ {msg}{R}")
+
+
+def _on_end(event):
+    print()
+
+
+_HANDLERS = {
+    "user": _on_user,
+    "think": _on_think,
+    "respond": _on_respond,
+    "call": _on_call,
+    "result": _on_result,
+    "error": _on_error,
+    "end": _on_end,
+}
+
+
 async def render(stream):
     try:
         async for event in stream:
-            match event["type"]:
-                case "user":
-                    if event.get("content"):
-                        print(f"{CYAN}${R} {event['content']}")
-                case "think":
-                    if event.get("content"):
-                        print(f"{GRAY}{event['content']}{R}", end="", flush=True)
-                case "respond":
-                    if event.get("content"):
-                        print(event["content"], end="", flush=True)
-                case "call":
-                    call = json.loads(event.get("content", "{}"))
-                    name = call.get("name", "?")
-                    args = call.get("args", {})
-                    arg_str = ", ".join(f"{k}={v!r}" for k, v in list(args.items())[:2])
-                    if len(args) > 2:
-                        arg_str += ", ..."
-                    print(f"\n{GRAY}○ {name}({arg_str}){R}")
-                case "result":
-                    payload = event.get("payload", {})
-                    is_error = payload.get("error", False)
-                    symbol = f"{RED}✗{R}" if is_error else f"{GREEN}●{R}"
-                    msg = payload.get("outcome") or payload.get("message") or "ok"
-                    print(f"{symbol} {msg}")
-                case "error":
-                    msg = event.get("payload", {}).get("error") or event.get("content", "error")
-                    print(f"{RED}✗ {msg}{R}")
-                case "end":
-                    print()
+            handler = _HANDLERS.get(event["type"])
+            if handler:
+                handler(event)
     except KeyboardInterrupt:
         print(f"\n{YELLOW}interrupted{R}")
 
@@ -3,7 +3,10 @@
 import asyncio
 import json
 import sqlite3
+import sys
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -15,6 +18,16 @@ if TYPE_CHECKING:
 
 HOME_DIR = Path.home() / ".cogency"
 
+# Per-connection tuning; journal_mode=WAL is persisted in the file by _init_schema.
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+"""
+# Map up to 256 MiB of the file for reads; 32-bit builds lack the address space for it.
+if sys.maxsize > 2**32:
+    _CONNECTION_PRAGMAS += "PRAGMA mmap_size=268435456;\n"
+
 
 def get_last_conversation() -> str | None:
     db_path = HOME_DIR / "store.db"
@@ -27,17 +40,39 @@ def get_last_conversation() -> str | None:
 
 
 class Snapshots:
-    def __init__(self, db_path: Path = HOME_DIR / "store.db"):
+    def __init__(
+        self, db_path: Path = HOME_DIR / "store.db", time_fn: Callable[[], float] = time.time
+    ):
         self.db_path = db_path
+        self._time_fn = time_fn
+        self._db: sqlite3.Connection | None = None
+        # One worker owns all database work, so queries on the shared connection never interleave.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshots-sqlite")
         self._init_schema()
 
-    def _connect(self):
-        path = Path(self.db_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        return sqlite3.connect(path)
+    def _connect(self) -> sqlite3.Connection:
+        """Return the shared connection, opening it on first use."""
+        if self._db is None:
+            path = Path(self.db_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            db.row_factory = sqlite3.Row
+            db.executescript(_CONNECTION_PRAGMAS)
+            self._db = db
+        return self._db
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    async def _run(self, fn: Callable[[], Any]) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn)
 
     def _init_schema(self):
         with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
             db.executescript("""
                 CREATE TABLE IF NOT EXISTS sessions (
                     session_id TEXT PRIMARY KEY,
@@ -48,7 +83,9 @@ class Snapshots:
                     created_at REAL NOT NULL,
                     UNIQUE(tag, user_id)
                 );
-                CREATE INDEX IF NOT EXISTS idx_sessions_user ON sessions(user_id);
+                DROP INDEX IF EXISTS idx_sessions_user;
+                CREATE INDEX IF NOT EXISTS idx_sessions_user_created
+                    ON sessions(user_id, created_at DESC);
                 CREATE INDEX IF NOT EXISTS idx_sessions_tag ON sessions(tag);
             """)
 
@@ -62,12 +99,12 @@ class Snapshots:
             with self._connect() as db:
                 db.execute(
                     "INSERT INTO sessions (session_id, tag, conversation_id, user_id, model_config, created_at) VALUES (?, ?, ?, ?, ?, ?)",
-                    (session_id, tag, conversation_id, user_id, model_config_json, time.time()),
+                    (session_id, tag, conversation_id, user_id, model_config_json, self._time_fn()),
                 )
                 return session_id
 
         try:
-            return await asyncio.get_event_loop().run_in_executor(None, _sync)
+            return await self._run(_sync)
         except sqlite3.IntegrityError:
             return await self.overwrite_session(tag, conversation_id, user_id, model_config)
 
@@ -81,11 +118,11 @@ class Snapshots:
             with self._connect() as db:
                 db.execute(
                     "UPDATE sessions SET conversation_id = ?, model_config = ?, created_at = ? WHERE tag = ? AND user_id = ?",
-                    (conversation_id, model_config_json, time.time(), tag, user_id),
+                    (conversation_id, model_config_json, self._time_fn(), tag, user_id),
                 )
                 return tag
 
-        return await asyncio.get_event_loop().run_in_executor(None, _sync)
+        return await self._run(_sync)
 
     @retry(attempts=3, base_delay=0.1)
     async def delete_session(self, tag: str, user_id: str) -> int:
@@ -96,13 +133,12 @@ class Snapshots:
                 )
                 return cursor.rowcount
 
-        return await asyncio.get_event_loop().run_in_executor(None, _sync)
+        return await self._run(_sync)
 
     @retry(attempts=3, base_delay=0.1)
     async def list_sessions(self, user_id: str) -> list[dict[str, Any]]:
         def _sync():
             with self._connect() as db:
-                db.row_factory = sqlite3.Row
                 rows = db.execute(
                     "SELECT tag, conversation_id, created_at, model_config FROM sessions WHERE user_id = ? ORDER BY created_at DESC",
                     (user_id,),
@@ -117,13 +153,12 @@ class Snapshots:
                     for row in rows
                 ]
 
-        return await asyncio.get_event_loop().run_in_executor(None, _sync)
+        return await self._run(_sync)
 
     @retry(attempts=3, base_delay=0.1)
     async def load_session(self, tag: str, user_id: str) -> dict[str, Any] | None:
         def _sync():
             with self._connect() as db:
-                db.row_factory = sqlite3.Row
                 row = db.execute(
                     "SELECT tag, conversation_id, created_at, model_config FROM sessions WHERE tag = ? AND user_id = ?",
                     (tag, user_id),
@@ -137,7 +172,7 @@ class Snapshots:
                     }
                 return None
 
-        return await asyncio.get_event_loop().run_in_executor(None, _sync)
+        return await self._run(_sync)
 
 
 def storage(config: "Config"):
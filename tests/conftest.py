@@ -1,12 +1,16 @@
 """Pytest configuration and fixtures for cogency-cc testing."""
 
 from collections.abc import AsyncGenerator
-from unittest.mock import patch
+from dataclasses import MISSING, dataclass, fields
+from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 from cogency.core.protocols import LLM
 from typer.testing import CliRunner
 
+from cc.config import Config
+
 
 class MockLLM(LLM):
     def __init__(self, api_key: str = "mock-key"):
@@ -54,6 +58,47 @@ class MockLLM(LLM):
         pass
 
 
+async def _stream(*events: dict) -> AsyncGenerator[dict, None]:
+    """Yield the given events as an async event stream."""
+    for event in events:
+        yield event
+
+
+def bare_config(**overrides) -> Config:
+    """Build a Config from field defaults without running __post_init__ (no .env read)."""
+    config = object.__new__(Config)
+    for f in fields(Config):
+        if f.default is not MISSING:
+            setattr(config, f.name, f.default)
+        elif f.default_factory is not MISSING:
+            setattr(config, f.name, f.default_factory())
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    if "config_file" not in overrides:
+        config.config_file = config.config_dir / "cc.json"
+    return config
+
+
+@dataclass(slots=True)
+class MockConfig:
+    config_dir: Path
+    conversation_id: str | None = None
+    user_id: str = "test_user"
+    debug_mode: bool = False
+
+
+_INTEGRATION_DIR = Path(__file__).parent / "integration"
+
+
+def pytest_collection_modifyitems(items):
+    """Tag tests as unit or integration by directory so `-m unit` selects the fast tier."""
+    for item in items:
+        if item.path.is_relative_to(_INTEGRATION_DIR):
+            item.add_marker(pytest.mark.integration)
+        else:
+            item.add_marker(pytest.mark.unit)
+
+
 @pytest.fixture
 def cli_runner():
     return CliRunner()
@@ -64,35 +109,27 @@ def mock_llm():
     return MockLLM()
 
 
+_TEST_API_KEYS = {
+    "GLM_API_KEY": "test-glm-key",
+    "OPENAI_API_KEY": "test-openai-key",
+    "ANTHROPIC_API_KEY": "test-anthropic-key",
+    "GEMINI_API_KEY": "test-gemini-key",
+}
+
+
 @pytest.fixture
-def mock_api_keys():
-    with patch.dict(
-        "os.environ",
-        {
-            "GLM_API_KEY": "test-glm-key",
-            "OPENAI_API_KEY": "test-openai-key",
-            "ANTHROPIC_API_KEY": "test-anthropic-key",
-            "GEMINI_API_KEY": "test-gemini-key",
-        },
-    ):
-        yield
+def mock_api_keys(monkeypatch):
+    for key, value in _TEST_API_KEYS.items():
+        monkeypatch.setenv(key, value)
 
 
 @pytest.fixture
 def mock_config(tmp_path):
-    from unittest.mock import Mock
-
-    config = Mock()
-    config.conversation_id = None
-    config.user_id = "test_user"
-    config.debug_mode = False
-    config.config_dir = tmp_path / ".cogency"
+    config = MockConfig(config_dir=tmp_path / ".cogency")
     config.config_dir.mkdir(exist_ok=True)
     return config
 
 
 @pytest.fixture
 def mock_snapshots():
-    from unittest.mock import Mock
-
     return Mock()
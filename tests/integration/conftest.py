@@ -1,4 +1,6 @@
+from collections.abc import Iterator
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -14,12 +16,23 @@ def project_root(tmp_path_factory) -> Path:
 
 
 @pytest.fixture
-def snapshots(project_root: Path) -> Snapshots:
+def snapshots(project_root: Path) -> Iterator[Snapshots]:
     db_path = project_root / ".cogency" / "snapshots.db"
-    return Snapshots(db_path=str(db_path))
+    snapshots = Snapshots(db_path=str(db_path))
+    yield snapshots
+    snapshots.close()
 
 
 @pytest.fixture
 def config(project_root: Path) -> Config:
     config_dir = project_root / ".cogency"
     return Config(config_dir=config_dir, user_id="test_user")
+
+
+@pytest.fixture
+def mock_agent_class(monkeypatch) -> MagicMock:
+    """Stub the GLM client and Agent class used by create_agent."""
+    monkeypatch.setattr("cc.agent.GLM", MagicMock())
+    agent_class = MagicMock()
+    monkeypatch.setattr("cc.agent.Agent", agent_class)
+    return agent_class
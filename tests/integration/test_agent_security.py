@@ -1,25 +1,13 @@
-from unittest.mock import MagicMock, patch
+from cogency.core.config import Security
 
 from cc.agent import create_agent
 
 
-@patch("cc.agent.GLM")
-@patch("cc.agent.Config")
-def test_security_configuration(mock_config_class, mock_glm):
-    from cogency.core.config import Security
+def test_security_configuration(mock_agent_class, config, monkeypatch):
+    monkeypatch.setattr("cc.cc_md.load", lambda: None)
 
-    mock_config = MagicMock()
-    mock_config.provider = "glm"
-    mock_config.identity = "code"
-    mock_config.get_api_key.return_value = "test-key"
-    mock_config_class.return_value = mock_config
-    mock_glm.return_value = MagicMock()
+    create_agent(config)
 
-    with patch("cc.cc_md.load", return_value=None):
-        with patch("cc.agent.Agent") as mock_agent_class:
-            create_agent(mock_config)
-
-            call_args = mock_agent_class.call_args
-            security = call_args.kwargs["security"]
-            assert isinstance(security, Security)
-            assert security.access == "project"
+    security = mock_agent_class.call_args.kwargs["security"]
+    assert isinstance(security, Security)
+    assert security.access == "project"
@@ -3,8 +3,6 @@
 import asyncio
 from unittest.mock import patch
 
-import pytest
-
 from cc.agent import create_agent
 from cc.config import Config
 from tests.conftest import MockLLM
@@ -25,7 +23,6 @@ def test_with_mock_llm():
         assert hasattr(agent, "config")
 
 
-@pytest.mark.asyncio
 async def test_tool_execution():
     """Test that agent properly executes tools when given a query."""
     config = Config(provider="mock", user_id="test")
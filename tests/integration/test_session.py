@@ -6,8 +6,9 @@ import pytest
 
 from cc.cli import app as cli
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 
-@pytest.mark.asyncio
 @patch("cc.cli.run_agent")
 async def test_save_and_list_session(mock_run_agent, config, snapshots, cli_runner):
     config.conversation_id = "test_conv_1"
@@ -28,7 +29,6 @@ async def test_save_and_list_session(mock_run_agent, config, snapshots, cli_runn
     assert unique_tag in result.output
 
 
-@pytest.mark.asyncio
 @patch("cc.cli.run_agent")
 async def test_save_overwrite_and_resume(mock_run_agent, config, snapshots, cli_runner):
     config.conversation_id = "conv_old"
@@ -54,7 +54,6 @@ async def test_save_overwrite_and_resume(mock_run_agent, config, snapshots, cli_
     assert "Resumed session 'overwrite_test'." in result.output
 
 
-@pytest.mark.asyncio
 @patch("cc.cli.run_agent")
 async def test_resume_non_existent(mock_run_agent, cli_runner):
     loop = asyncio.get_event_loop()
@@ -0,0 +1,44 @@
+"""Session command output tests."""
+
+import datetime
+from unittest.mock import AsyncMock
+
+from cc.commands.session import _list_sessions
+
+_SESSIONS = [
+    {
+        "tag": "test_tag",
+        "conversation_id": "conv123",
+        "created_at": 1678886400,
+        "model_config": {"provider": "openai", "model": "gpt-4"},
+    },
+    {
+        "tag": "other_tag",
+        "conversation_id": "conv456",
+        "created_at": 1678886500,
+        "model_config": {"provider": "glm"},
+    },
+]
+
+
+async def test_list_sessions_prints_table(mock_config, mock_snapshots, capsys):
+    mock_snapshots.list_sessions = AsyncMock(return_value=_SESSIONS)
+
+    await _list_sessions(mock_config, mock_snapshots)
+
+    mock_snapshots.list_sessions.assert_awaited_once_with("test_user")
+    lines = capsys.readouterr().out.splitlines()
+    created_at = datetime.datetime.fromtimestamp(1678886400).strftime("%Y-%m-%d %H:%M:%S")
+    assert lines[0] == "Saved Sessions:"
+    assert lines[2] == "-" * 95
+    assert lines[3] == f"{'test_tag':15} {'conv123':38} {'openai/gpt-4':20} {created_at:20}"
+    assert lines[4].startswith(f"{'other_tag':15} {'conv456':38} {'glm/N/A':20}")
+    assert len(lines) == 5
+
+
+async def test_list_sessions_empty(mock_config, mock_snapshots, capsys):
+    mock_snapshots.list_sessions = AsyncMock(return_value=[])
+
+    await _list_sessions(mock_config, mock_snapshots)
+
+    assert capsys.readouterr().out == "No sessions saved.\n"
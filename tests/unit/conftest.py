@@ -0,0 +1,9 @@
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def temp_config_dir(tmp_path: Path) -> Path:
+    """Per-test .cogency path (not created)."""
+    return tmp_path / ".cogency"
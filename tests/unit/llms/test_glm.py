@@ -1,6 +1,7 @@
 """GLM provider tests."""
 
-from unittest.mock import patch
+import inspect
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -45,21 +46,21 @@ def test_config_parameters():
     assert glm.max_tokens == 2048
 
 
-def test_no_api_key_error():
+def test_no_api_key_error(monkeypatch):
     """Test GLM raises error without API key."""
-    with patch.dict("os.environ", {}, clear=True):
-        with pytest.raises(RuntimeError, match="No GLM API key found"):
-            GLM()
+    monkeypatch.delenv("GLM_API_KEY", raising=False)
+    with pytest.raises(RuntimeError, match="No GLM API key found"):
+        GLM()
 
 
-def test_env_key():
+def test_env_key(monkeypatch):
     """Test GLM picks up API key from environment."""
-    with patch.dict("os.environ", {"GLM_API_KEY": "env_key_test"}):
-        glm = GLM()
-        assert glm.api_key == "env_key_test"
+    monkeypatch.setenv("GLM_API_KEY", "env_key_test")
+    glm = GLM()
+    assert glm.api_key == "env_key_test"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_generate_method():
     """Test GLM generate method exists and is async."""
     glm = GLM(api_key="test_key")
@@ -69,12 +70,10 @@ async def test_generate_method():
     assert callable(glm.generate)
 
     # Method should be async
-    import inspect
-
     assert inspect.iscoroutinefunction(glm.generate)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_stream_method():
     """Test GLM stream method exists and is async."""
     glm = GLM(api_key="test_key")
@@ -84,16 +83,12 @@ async def test_stream_method():
     assert callable(glm.stream)
 
     # Method should be async generator
-    import inspect
-
     assert inspect.isasyncgenfunction(glm.stream)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_stream_no_duplicates():
     """Test GLM stream doesn't emit duplicate chunks."""
-    from unittest.mock import AsyncMock, MagicMock, patch
-
     glm = GLM(api_key="test_key")
 
     # Mock SSE response chunks
@@ -133,11 +128,9 @@ async def test_stream_no_duplicates():
         assert len(chunks) == 2
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_stream_handles_fragmented_sse_messages():
     """Test GLM properly reassembles SSE messages split across TCP packets."""
-    from unittest.mock import AsyncMock, MagicMock, patch
-
     glm = GLM(api_key="test_key")
 
     # Mock fragmented TCP packets - this is what causes character-by-character streaming
@@ -181,11 +174,9 @@ async def test_stream_handles_fragmented_sse_messages():
         assert len(chunks) == 3
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_stream_emits_tokens_immediately():
     """Test GLM emits tokens as soon as they're received (character-by-character is correct)."""
-    from unittest.mock import AsyncMock, MagicMock, patch
-
     glm = GLM(api_key="test_key")
 
     # Mock character-by-character TCP packets - this is desired behavior
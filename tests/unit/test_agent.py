@@ -9,7 +9,7 @@ from cc.agent import _create_llm, create_agent
 from cc.config import Config
 
 
-def test_create_agent_with_default_config():
+def test_create_agent_with_default_config(monkeypatch):
     config = Mock(spec=Config)
     config.provider = "openai"
     config.model = "gpt-4"
@@ -17,63 +17,56 @@ def test_create_agent_with_default_config():
     config.get_api_key.return_value = "test-key"
     config.config_dir = Path("/tmp/.cogency")
 
-    with (
-        patch("cogency.tools") as mock_tools,
-        patch("cc.cc_md.load") as mock_cc_md_load,
-    ):
-        mock_tools.category.return_value = ["file_tool", "system_tool"]
-        mock_cc_md_load.return_value = (
-            "--- User .cogency/cc.md ---\nHelp with coding\n--- End .cogency/cc.md ---"
-        )
-
-        with (
-            patch("cc.agent._create_llm") as mock_create_llm,
-            patch("cc.agent.Agent") as mock_agent_class,
-        ):
-            mock_llm = Mock()
-            mock_llm.http_model = "gpt-4"
-            mock_create_llm.return_value = mock_llm
-
-            mock_agent = Mock()
-            mock_agent_class.return_value = mock_agent
-
-            create_agent(config)
-
-            mock_agent_class.assert_called_once()
-            call_kwargs = mock_agent_class.call_args[1]
-            assert call_kwargs["max_iterations"] == 42
-            assert call_kwargs["profile"] is True
-            assert call_kwargs["mode"] == "replay"
-            assert "Help with coding" in call_kwargs["instructions"]
-            assert "--- User .cogency/cc.md ---" in call_kwargs["instructions"]
-
-
-def test_create_agent_with_cli_instruction():
+    mock_tools = Mock()
+    mock_tools.category.return_value = ["file_tool", "system_tool"]
+    mock_llm = Mock()
+    mock_llm.http_model = "gpt-4"
+    mock_agent_class = Mock()
+
+    monkeypatch.setattr("cogency.tools", mock_tools)
+    monkeypatch.setattr(
+        "cc.cc_md.load",
+        lambda: "--- User .cogency/cc.md ---\nHelp with coding\n--- End .cogency/cc.md ---",
+    )
+    monkeypatch.setattr("cc.agent._create_llm", Mock(return_value=mock_llm))
+    monkeypatch.setattr("cc.agent.Agent", mock_agent_class)
+
+    create_agent(config)
+
+    mock_agent_class.assert_called_once()
+    call_kwargs = mock_agent_class.call_args[1]
+    assert call_kwargs["max_iterations"] == 42
+    assert call_kwargs["profile"] is True
+    assert call_kwargs["mode"] == "replay"
+    assert "Help with coding" in call_kwargs["instructions"]
+    assert "--- User .cogency/cc.md ---" in call_kwargs["instructions"]
+
+
+def test_create_agent_with_cli_instruction(monkeypatch):
     config = Mock(spec=Config)
     config.get_api_key.return_value = "test-key"
     config.model = "some-model"
     config.config_dir = Path("/tmp/.cogency")
 
-    with (
-        patch("cc.agent._create_llm"),
-        patch("cogency.tools") as mock_tools,
-        patch("cc.agent.Agent") as mock_agent_class,
-        patch("cc.cc_md.load") as mock_cc_md_load,
-    ):
-        mock_tools.category.return_value = []
-        mock_agent = Mock()
-        mock_agent_class.return_value = mock_agent
-        mock_cc_md_load.return_value = (
-            "--- User .cogency/cc.md ---\nProject instructions\n--- End .cogency/cc.md ---"
-        )
+    mock_tools = Mock()
+    mock_tools.category.return_value = []
+    mock_agent_class = Mock()
+
+    monkeypatch.setattr("cc.agent._create_llm", Mock())
+    monkeypatch.setattr("cogency.tools", mock_tools)
+    monkeypatch.setattr("cc.agent.Agent", mock_agent_class)
+    monkeypatch.setattr(
+        "cc.cc_md.load",
+        lambda: "--- User .cogency/cc.md ---\nProject instructions\n--- End .cogency/cc.md ---",
+    )
 
-        create_agent(config, cli_instruction="fix this bug")
+    create_agent(config, cli_instruction="fix this bug")
 
-        call_kwargs = mock_agent_class.call_args[1]
-        assert call_kwargs["profile"] is False
-        assert "fix this bug" in call_kwargs["instructions"]
-        assert "Project instructions" in call_kwargs["instructions"]
-        assert "--- User .cogency/cc.md ---" in call_kwargs["instructions"]
+    call_kwargs = mock_agent_class.call_args[1]
+    assert call_kwargs["profile"] is False
+    assert "fix this bug" in call_kwargs["instructions"]
+    assert "Project instructions" in call_kwargs["instructions"]
+    assert "--- User .cogency/cc.md ---" in call_kwargs["instructions"]
 
 
 def test_create_agent_invalid_provider():
@@ -86,27 +79,18 @@ def test_create_agent_invalid_provider():
         create_agent(config)
 
 
-def test_create_openai_with_custom_model():
+@pytest.mark.parametrize("provider,llm_class", [("openai", "OpenAI"), ("glm", "GLM")])
+def test_create_llm_with_custom_model(provider, llm_class):
     config = Mock(spec=Config)
     config.model = "some-model"
-    config.get_api_key.return_value = "openai-key"
+    config.get_api_key.return_value = f"{provider}-key"
 
-    with patch("cc.agent.OpenAI") as mock_openai:
-        _create_llm("openai", config)
-        mock_openai.assert_called_once_with(api_key="openai-key", http_model="some-model")
+    with patch(f"cc.agent.{llm_class}") as mock_llm:
+        _create_llm(provider, config)
+        mock_llm.assert_called_once_with(api_key=f"{provider}-key", http_model="some-model")
 
 
-def test_create_glm_default():
-    config = Mock(spec=Config)
-    config.model = "some-model"
-    config.get_api_key.return_value = "glm-key"
-
-    with patch("cc.agent.GLM") as mock_glm:
-        _create_llm("glm", config)
-        mock_glm.assert_called_once_with(api_key="glm-key", http_model="some-model")
-
-
-def test_security_boundary_enforced():
+def test_security_boundary_enforced(monkeypatch):
     config = Mock(spec=Config)
     config.provider = "openai"
     config.identity = "code"
@@ -114,15 +98,14 @@ def test_security_boundary_enforced():
     config.model = "some-model"
     config.config_dir = Path("/tmp/.cogency")
 
-    with (
-        patch("cogency.tools"),
-        patch("cc.cc_md.load") as mock_cc_md_load,
-        patch("cc.agent._create_llm"),
-        patch("cc.agent.Agent") as mock_agent,
-    ):
-        mock_cc_md_load.return_value = None
-        create_agent(config)
+    mock_agent = Mock()
+    monkeypatch.setattr("cogency.tools", Mock())
+    monkeypatch.setattr("cc.cc_md.load", lambda: None)
+    monkeypatch.setattr("cc.agent._create_llm", Mock())
+    monkeypatch.setattr("cc.agent.Agent", mock_agent)
+
+    create_agent(config)
 
-        call_args = mock_agent.call_args
-        assert call_args[1]["security"].access == "project"
-        assert "Working directory:" in call_args[1]["instructions"]
+    call_args = mock_agent.call_args
+    assert call_args[1]["security"].access == "project"
+    assert "Working directory:" in call_args[1]["instructions"]
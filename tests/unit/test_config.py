@@ -1,25 +1,34 @@
 """Test configuration state management."""
 
 import json
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
 from cc.config import Config, _default_config_dir
+from tests.conftest import bare_config
 
 
-@pytest.fixture
-def temp_config_dir(tmp_path: Path) -> Path:
-    """Create a temporary config directory for testing."""
-    return tmp_path / ".cogency"
+@pytest.fixture(scope="module")
+def default_config() -> Config:
+    """One default Config shared by the read-only defaults checks."""
+    return Config()
 
 
-def test_config_initialization_defaults():
-    config = Config()
-    assert config.provider == "glm"
-    assert config.model is None
-    assert config.user_id == "cc_user"
+@pytest.mark.parametrize(
+    "attr,expected",
+    [
+        ("provider", "glm"),
+        ("model", None),
+        ("user_id", "cc_user"),
+        ("api_keys", {}),
+        ("debug_mode", False),
+    ],
+)
+def test_config_defaults(default_config: Config, attr: str, expected):
+    assert getattr(default_config, attr) == expected
 
 
 def test_config_post_init_sets_correct_path(temp_config_dir: Path):
@@ -36,26 +45,59 @@ def test_save_and_load_cycle(temp_config_dir: Path):
     config_save.save()
 
     assert config_save.config_file.exists()
+    assert [p.name for p in temp_config_dir.iterdir()] == ["cc.json"]
 
     config_load = Config(config_dir=temp_config_dir)
     config_load.load()
 
-    assert config_load.provider == "openai"
-    assert config_load.model == "gpt-5-codex-low"
-    assert config_load.user_id == "test_user"
+    assert config_load.to_dict() == config_save.to_dict()
+
+
+@pytest.mark.parametrize("mode", [0o600, 0o640])
+def test_save_preserves_file_mode(temp_config_dir: Path, mode: int):
+    config = Config(config_dir=temp_config_dir)
+    config.save()
+    assert stat.S_IMODE(config.config_file.stat().st_mode) == 0o600
+    config.config_file.chmod(mode)
+
+    config.save()
+
+    assert stat.S_IMODE(config.config_file.stat().st_mode) == mode
+
+
+def test_concurrent_saves(temp_config_dir: Path):
+    configs = [Config(config_dir=temp_config_dir, user_id=f"user-{i}") for i in range(4)]
+
+    with ThreadPoolExecutor(max_workers=len(configs)) as pool:
+        list(pool.map(lambda config: config.save(), configs))
+
+    loaded = Config.load_or_default(config_dir=temp_config_dir)
+    assert loaded.user_id in {config.user_id for config in configs}
+    assert [p.name for p in temp_config_dir.iterdir()] == ["cc.json"]
 
 
 def test_load_from_non_existent_file(temp_config_dir: Path):
     """Test that loading from a non-existent file results in default values."""
-    config = Config(config_dir=temp_config_dir)
+    config = Config.load_or_default(config_dir=temp_config_dir)
+
     # Ensure the file doesn't exist
     assert not config.config_file.exists()
-
-    config.load()
-
     # Assert that the config retains its default values
     assert config.provider == "glm"
     assert config.model is None
+    assert config.user_id == "cc_user"
+
+
+def test_load_from_existing_file(temp_config_dir: Path):
+    expected = {"user_id": "test_user", "provider": "openai", "model": "gpt-4"}
+    temp_config_dir.mkdir()
+    (temp_config_dir / "cc.json").write_text(json.dumps(expected))
+
+    config = bare_config(config_dir=temp_config_dir)
+    config.load()
+
+    config_dict = config.to_dict()
+    assert {key: config_dict[key] for key in expected} == expected
 
 
 def test_load_from_corrupted_json(temp_config_dir: Path):
@@ -81,46 +123,34 @@ def test_update_method_changes_and_saves(temp_config_dir: Path):
     # Verify that the changes were saved to the file
     config_load = Config(config_dir=temp_config_dir)
     config_load.load()
-    assert config_load.provider == "anthropic"
-    assert config_load.model == "claude-3.5-sonnet"
+    assert config_load.to_dict() == config.to_dict()
 
 
-def test_get_api_key_priority(temp_config_dir: Path):
+def test_get_api_key_priority(temp_config_dir: Path, monkeypatch):
     """Test the priority of API key retrieval: env > saved keys."""
     config = Config(config_dir=temp_config_dir)
     config.api_keys = {"openai": "saved-key"}
     config.save()
 
     # 1. No environment variable, should use saved key
-    with patch.dict("os.environ", clear=True):
-        with patch("cc.config.rotated_api_key", return_value=None):
-            assert config.get_api_key("openai") == "saved-key"
+    monkeypatch.setattr("cc.config.rotated_api_key", lambda provider: None)
+    assert config.get_api_key("openai") == "saved-key"
 
-    # 2. With environment variable, should use env key
-    with patch("cc.config.rotated_api_key", return_value="env-key"):
-        assert config.get_api_key("openai") == "env-key"
+    # 2. No key found
+    assert config.get_api_key("anthropic") is None
 
-    # 3. No key found
-    with patch.dict("os.environ", clear=True):
-        with patch("cc.config.rotated_api_key", return_value=None):
-            assert config.get_api_key("anthropic") is None
+    # 3. With environment variable, should use env key
+    monkeypatch.setattr("cc.config.rotated_api_key", lambda provider: "env-key")
+    assert config.get_api_key("openai") == "env-key"
 
 
-def test_default_config_dir_logic():
+def test_default_config_dir_logic(monkeypatch):
     """Test the logic for determining the default config directory."""
     # 1. Pytest environment
-    with patch.dict("os.environ", {"PYTEST_CURRENT_TEST": "true"}, clear=True):
-        assert "cogency-cc-tests" in str(_default_config_dir())
+    monkeypatch.setenv("PYTEST_CURRENT_TEST", "true")
+    assert "cogency-cc-tests" in str(_default_config_dir())
 
     # 2. Default to home directory
-    with patch.dict("os.environ", clear=True):
-        with patch("pathlib.Path.home", return_value=Path("/fake/home")):
-            with patch("cc.config.Path") as mock_path:
-                # Mock Path.cwd() to return a fake directory
-                mock_path.cwd.return_value = Path("/fake/cwd")
-                # Mock the project-local .cogency directory to not exist
-                mock_path.return_value.is_dir.return_value = False
-                # Mock Path.home() to return our fake home
-                mock_path.home.return_value = Path("/fake/home")
-
-                assert _default_config_dir() == Path("/fake/home/.cogency")
+    monkeypatch.delenv("PYTEST_CURRENT_TEST")
+    monkeypatch.setattr(Path, "home", classmethod(lambda cls: Path("/fake/home")))
+    assert _default_config_dir() == Path("/fake/home/.cogency")
@@ -0,0 +1,38 @@
+"""Stream renderer output tests."""
+
+from cc.render import GRAY, GREEN, R, render
+from tests.conftest import _stream
+
+EXPECTED_LS_CALL = f"{GRAY}○ ls(path='.'){R}"
+EXPECTED_LS_RESULT = f"{GREEN}●{R} 2 items"
+
+
+async def test_call_and_result(capsys):
+    await render(
+        _stream(
+            {"type": "call", "content": '{"name": "ls", "args": {"path": "."}}'},
+            {"type": "result", "payload": {"outcome": "2 items"}},
+        )
+    )
+
+    out = capsys.readouterr().out
+    assert EXPECTED_LS_CALL in out
+    assert EXPECTED_LS_RESULT in out
+
+
+async def test_repeated_call_renders_each_time(capsys):
+    call = {"type": "call", "content": '{"name": "read", "args": {"file": "a.py"}}'}
+    await render(_stream(call, call))
+
+    assert capsys.readouterr().out.count("○ read(file='a.py')") == 2
+
+
+async def test_unhandled_events_are_skipped(capsys):
+    await render(
+        _stream(
+            {"type": "metric", "step": {}, "total": {}},
+            {"type": "respond", "content": "done"},
+        )
+    )
+
+    assert capsys.readouterr().out == "done"
@@ -0,0 +1,109 @@
+"""Snapshots storage tests."""
+
+import asyncio
+import itertools
+import sys
+
+import pytest
+
+from cc.storage import Snapshots
+
+
+@pytest.fixture
+def snapshots(tmp_path):
+    snapshots = Snapshots(db_path=tmp_path / "snapshots.db", time_fn=itertools.count(1).__next__)
+    yield snapshots
+    snapshots.close()
+
+
+def test_wal_journal_mode(snapshots: Snapshots):
+    db = snapshots._connect()
+    assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert db.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+
+@pytest.mark.skipif(sys.maxsize <= 2**32, reason="mmap is only enabled on 64-bit builds")
+def test_mmap_enabled(snapshots: Snapshots):
+    assert snapshots._connect().execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+
+
+def test_sessions_schema(snapshots: Snapshots):
+    columns = [row[1] for row in snapshots._connect().execute("PRAGMA table_info(sessions)")]
+
+    assert columns == [
+        "session_id",
+        "tag",
+        "conversation_id",
+        "user_id",
+        "model_config",
+        "created_at",
+    ]
+
+
+def test_list_sessions_uses_user_created_index(snapshots: Snapshots):
+    db = snapshots._connect()
+    indexes = {
+        row[0]
+        for row in db.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND name LIKE 'idx_sessions_%'"
+        )
+    }
+    plan = " ".join(
+        row[3]
+        for row in db.execute(
+            "EXPLAIN QUERY PLAN SELECT tag FROM sessions WHERE user_id = ? ORDER BY created_at DESC",
+            ("user-1",),
+        )
+    )
+
+    assert "idx_sessions_user_created" in indexes
+    assert "idx_sessions_user" not in indexes
+    assert "idx_sessions_user_created" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_connection_is_reused(snapshots: Snapshots):
+    assert snapshots._connect() is snapshots._connect()
+
+
+async def test_save_and_load_session(snapshots: Snapshots):
+    await snapshots.save_session("tag", "conv-1", "user-1", {"provider": "glm", "model": None})
+
+    loaded = await snapshots.load_session("tag", "user-1")
+
+    assert loaded["conversation_id"] == "conv-1"
+    assert loaded["model_config"] == {"provider": "glm", "model": None}
+    assert await snapshots.load_session("tag", "user-2") is None
+
+
+async def test_save_existing_tag_overwrites(snapshots: Snapshots):
+    await snapshots.save_session("tag", "conv-1", "user-1", {"provider": "glm"})
+    await snapshots.save_session("tag", "conv-2", "user-1", {"provider": "openai"})
+
+    sessions = await snapshots.list_sessions("user-1")
+
+    assert [(s["tag"], s["conversation_id"]) for s in sessions] == [("tag", "conv-2")]
+
+
+async def test_list_sessions_newest_first(snapshots: Snapshots):
+    for tag in ("first", "second", "third"):
+        await snapshots.save_session(tag, f"conv-{tag}", "user-1", {"provider": "glm"})
+    await snapshots.save_session("other", "conv-other", "user-2", {"provider": "glm"})
+
+    sessions = await snapshots.list_sessions("user-1")
+
+    assert [s["tag"] for s in sessions] == ["third", "second", "first"]
+    assert [s["created_at"] for s in sessions] == [3, 2, 1]
+
+
+async def test_concurrent_saves(snapshots: Snapshots):
+    tags = [f"tag-{i}" for i in range(5)]
+
+    session_ids = await asyncio.gather(
+        *(snapshots.save_session(tag, f"conv-{tag}", "user-1", {"provider": "glm"}) for tag in tags)
+    )
+    sessions = await snapshots.list_sessions("user-1")
+
+    assert len(set(session_ids)) == len(tags)
+    assert sorted(s["tag"] for s in sessions) == tags
+    assert sorted(s["created_at"] for s in sessions) == [1, 2, 3, 4, 5]